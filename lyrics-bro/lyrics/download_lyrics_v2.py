@@ -1,6 +1,20 @@
-import requests
 import json
 import os
+import sys
+import csv
+import hashlib
+import shutil
+import tempfile
+import atexit
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+# orjson decodes API responses several times faster, use it when installed
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
 
 class Colors:
     """ANSI color codes"""
@@ -12,6 +26,179 @@ class Colors:
     DIM = '\033[2m'
     END = '\033[0m'
 
+# Shared HTTP session so repeated lookups reuse the same keep-alive
+# connection (and TLS session) to lrclib.net instead of reconnecting.
+# Created by _get_session() on the first lookup, so requests is only
+# imported once there is actually something to download
+_SESSION = None
+
+def _get_session():
+    """Return the shared HTTP session, creating it on first use"""
+    global _SESSION
+    if _SESSION is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+        
+        session = requests.Session()
+        session.mount("https://", HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=4,
+            # Only retry busy/failing servers. Connection, timeout and
+            # certificate errors are reported (or trigger the SSL fallback)
+            # straight away instead of after several slow attempts
+            max_retries=Retry(
+                total=3,
+                connect=0,
+                read=0,
+                other=0,
+                backoff_factor=0.3,
+                status_forcelist=(429, 500, 502, 503, 504),
+                raise_on_status=False,
+            ),
+        ))
+        _SESSION = session
+    return _SESSION
+
+# LRClib API endpoints
+GET_URL = "https://lrclib.net/api/get"
+SEARCH_URL = "https://lrclib.net/api/search"
+
+# Write buffer for saved .lrc files - large enough to write a whole file at once
+WRITE_BUFFER_SIZE = 1 << 16
+
+# Characters that are not allowed in filenames: path separators become '-',
+# the rest are dropped
+_FILENAME_TABLE = str.maketrans({
+    '/': '-', '\\': '-', ':': '-',
+    '*': None, '?': None, '"': None, '<': None, '>': None, '|': None,
+})
+
+# Local copy of every successful download, so asking for the same song again
+# skips the network entirely
+CACHE_FOLDER = os.path.join(os.path.expanduser("~"), ".cache", "lyrics-bro")
+
+# Where previous artist/song entries are remembered between sessions
+HISTORY_FILE = os.path.join(os.path.expanduser("~"), ".lyrics_bro_history")
+
+# Number of lookups a batch download keeps in flight at once
+# (matches the session pool size, and stays polite to LRClib)
+BATCH_WORKERS = 4
+
+def _find_lyrics(artist, song, on_ssl_fallback=None):
+    """
+    Look up the best LRClib match for a song
+    
+    Tries with SSL verification first. If that fails (some antivirus and
+    firewall setups break certificate checks), calls on_ssl_fallback and
+    tries again without verification.
+    
+    Returns:
+        tuple: (response, result) where result is the matched record or None
+    """
+    import requests
+    
+    try:
+        return _lookup_lyrics(artist, song, verify=True)
+    except requests.exceptions.SSLError:
+        # If SSL fails, try without verification (less secure but works)
+        if on_ssl_fallback:
+            on_ssl_fallback()
+        import urllib3
+        urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+        return _lookup_lyrics(artist, song, verify=False)
+
+def _lookup_lyrics(artist, song, verify):
+    """
+    Query LRClib for a song
+    
+    Tries the exact-match /get endpoint first, which returns a single record,
+    and only falls back to the (much larger) /search listing on a 404 or when
+    that record has no synchronized lyrics.
+    
+    Returns:
+        tuple: (response, result) where result is the matched record or None
+    """
+    params = {
+        "artist_name": artist,
+        "track_name": song
+    }
+    
+    session = _get_session()
+    
+    exact_match = None
+    
+    response = session.get(GET_URL, params=params, timeout=15, verify=verify)
+    if response.status_code == 200:
+        exact_match = _json_loads(response.content)
+        if exact_match and exact_match.get('syncedLyrics'):
+            return response, exact_match
+    elif response.status_code != 404:
+        return response, None
+    
+    # Not found, or only plain lyrics (or an instrumental): search instead,
+    # another upload of the song often has timestamps
+    search_response = session.get(SEARCH_URL, params=params, timeout=15, verify=verify)
+    if search_response.status_code != 200:
+        if exact_match:
+            return response, exact_match
+        return search_response, None
+    
+    results = _json_loads(search_response.content)
+    
+    # Get the first result with synchronized lyrics (results come best match first)
+    for result in results:
+        if result.get('syncedLyrics'):
+            return search_response, result
+    
+    # Nothing synced anywhere - return what there is, so the caller can say so
+    if exact_match:
+        return search_response, exact_match
+    return search_response, results[0] if results else None
+
+def _cache_path(artist, song):
+    """Path of the cached .lrc file for an artist/song pair"""
+    key = hashlib.sha1(f"{artist.lower()}\0{song.lower()}".encode('utf-8')).hexdigest()
+    return os.path.join(CACHE_FOLDER, f"{key}.lrc")
+
+def _copy_from_cache(artist, song, output_file):
+    """Copy cached lyrics to output_file, returns True on a cache hit"""
+    cache_file = _cache_path(artist, song)
+    if not os.path.exists(cache_file):
+        return False
+    
+    try:
+        shutil.copyfile(cache_file, output_file)
+        return True
+    except OSError:
+        return False
+
+def _save_to_cache(artist, song, synced_lyrics):
+    """Store downloaded lyrics in the cache (failures are ignored)"""
+    tmp_file = None
+    try:
+        os.makedirs(CACHE_FOLDER, exist_ok=True)
+        
+        # Write to a temp file and swap it in, so a half-written file
+        # is never picked up as a cache hit
+        fd, tmp_file = tempfile.mkstemp(dir=CACHE_FOLDER, suffix='.tmp')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(synced_lyrics)
+        os.replace(tmp_file, _cache_path(artist, song))
+    except OSError:
+        # Don't leave the partial temp file behind in the cache folder
+        if tmp_file is not None:
+            try:
+                os.remove(tmp_file)
+            except OSError:
+                pass
+
+def suggest_filename(artist, song):
+    """Build a safe .lrc filename from artist and song title"""
+    suggested_filename = f"{artist} - {song}.lrc"
+    # Replace invalid characters for filenames
+    return suggested_filename.translate(_FILENAME_TABLE)
+
 def download_synced_lyrics(artist, song, output_file="lyrics.lrc"):
     """
     Download synchronized lyrics from LRClib API
@@ -24,44 +211,33 @@ def download_synced_lyrics(artist, song, output_file="lyrics.lrc"):
     Returns:
         bool: True if successful, False otherwise
     """
+    import requests
     
     print(f"{Colors.CYAN}Searching for lyrics...{Colors.END}")
     print(f"  Artist: {Colors.BOLD}{artist}{Colors.END}")
     print(f"  Song: {Colors.BOLD}{song}{Colors.END}\n")
     
-    # LRClib API endpoint
-    api_url = "https://lrclib.net/api/search"
-    
-    # Search parameters
-    params = {
-        "artist_name": artist,
-        "track_name": song
-    }
+    # Already downloaded earlier? Reuse it
+    if _copy_from_cache(artist, song, output_file):
+        print(f"{Colors.GREEN}✓ Found lyrics in local cache!{Colors.END}\n")
+        print(f"{Colors.GREEN}✓ Lyrics saved to: {output_file}{Colors.END}\n")
+        return True
     
     try:
         # Make the API request with retry logic and SSL handling
         print(f"{Colors.DIM}Attempting connection...{Colors.END}")
         
-        # Try with SSL verification first
-        try:
-            response = requests.get(api_url, params=params, timeout=15)
-        except requests.exceptions.SSLError:
-            # If SSL fails, try without verification (less secure but works)
-            print(f"{Colors.YELLOW}⚠ SSL verification failed, trying alternate method...{Colors.END}")
-            import urllib3
-            urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
-            response = requests.get(api_url, params=params, timeout=15, verify=False)
+        # Try with SSL verification first, and without it if that fails
+        response, result = _find_lyrics(
+            artist, song,
+            on_ssl_fallback=lambda: print(f"{Colors.YELLOW}⚠ SSL verification failed, trying alternate method...{Colors.END}"),
+        )
         
         if response.status_code == 200:
-            results = response.json()
-            
-            if not results:
+            if not result:
                 print(f"{Colors.RED}✗ No lyrics found for this song{Colors.END}")
                 return False
             
-            # Get the first result (usually the best match)
-            result = results[0]
-            
             # Check if synchronized lyrics are available
             if not result.get('syncedLyrics'):
                 print(f"{Colors.YELLOW}⚠ Found lyrics but no synchronized timestamps{Colors.END}")
@@ -81,19 +257,19 @@ def download_synced_lyrics(artist, song, output_file="lyrics.lrc"):
             print(f"  Album: {result.get('albumName', 'Unknown')}")
             print(f"  Duration: {result.get('duration', 0)} seconds")
             
-            # Count lyrics lines
-            lines = [l for l in synced_lyrics.split('\n') if l.strip() and '[' in l]
-            print(f"  Lines: {len(lines)}\n")
+            # Count lyrics lines (every synced line starts with a [mm:ss.xx] tag)
+            print(f"  Lines: {synced_lyrics.count('[')}\n")
             
             # Save to file
-            with open(output_file, 'w', encoding='utf-8') as f:
+            with open(output_file, 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
                 f.write(synced_lyrics)
+            _save_to_cache(artist, song, synced_lyrics)
             
             print(f"{Colors.GREEN}✓ Lyrics saved to: {output_file}{Colors.END}\n")
             
             # Show preview
             print(f"{Colors.BOLD}Preview (first 5 lines):{Colors.END}")
-            preview_lines = synced_lyrics.split('\n')[:5]
+            preview_lines = synced_lyrics.split('\n', 5)[:5]
             for line in preview_lines:
                 if line.strip():
                     print(f"  {line}")
@@ -125,9 +301,145 @@ def download_synced_lyrics(artist, song, output_file="lyrics.lrc"):
         return False
 
 
+def _download_quietly(artist, song, output_file, on_ssl_fallback=None):
+    """Fetch and save synced lyrics for one song without console output"""
+    if _copy_from_cache(artist, song, output_file):
+        return True
+    
+    response, result = _find_lyrics(artist, song, on_ssl_fallback)
+    response.raise_for_status()
+    
+    synced_lyrics = result.get('syncedLyrics') if result else None
+    if not synced_lyrics:
+        return False
+    
+    with open(output_file, 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
+        f.write(synced_lyrics)
+    _save_to_cache(artist, song, synced_lyrics)
+    return True
+
+def download_batch(pairs):
+    """
+    Download synchronized lyrics for many songs concurrently
+    
+    Args:
+        pairs (list): (artist, song, output_file) tuples
+    
+    Returns:
+        int: Number of songs downloaded successfully
+    """
+    
+    print(f"{Colors.CYAN}Downloading lyrics for {len(pairs)} song(s)...{Colors.END}\n")
+    
+    succeeded = 0
+    
+    # Create the session up front, rather than racing to do it in several workers
+    _get_session()
+    
+    # Every lookup that fails SSL verification retries without it, but the
+    # warning only needs printing once per batch
+    ssl_warning_lock = threading.Lock()
+    ssl_warned = []
+    
+    def warn_ssl_fallback():
+        with ssl_warning_lock:
+            if not ssl_warned:
+                ssl_warned.append(True)
+                print(f"{Colors.YELLOW}⚠ SSL verification failed, retrying without it (less secure){Colors.END}")
+    
+    # Lookups are network-bound, so overlapping them hides the round-trip latency
+    with ThreadPoolExecutor(max_workers=BATCH_WORKERS) as executor:
+        futures = {executor.submit(_download_quietly, *pair, warn_ssl_fallback): pair for pair in pairs}
+        
+        for future in as_completed(futures):
+            artist, song, output_file = futures[future]
+            try:
+                success = future.result()
+            except Exception as e:
+                print(f"{Colors.RED}✗ {artist} - {song}: {e}{Colors.END}")
+                continue
+            
+            if success:
+                succeeded += 1
+                print(f"{Colors.GREEN}✓ {artist} - {song} → {output_file}{Colors.END}")
+            else:
+                print(f"{Colors.YELLOW}⚠ {artist} - {song}: no synchronized lyrics{Colors.END}")
+    
+    print(f"\n{Colors.BOLD}Downloaded {succeeded}/{len(pairs)} song(s){Colors.END}\n")
+    return succeeded
+
+def read_batch_file(path):
+    """
+    Read a CSV of songs to download
+    
+    Each row is: artist,song[,output_file]
+    """
+    pairs = []
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        for row in csv.reader(f):
+            if len(row) < 2 or not row[0].strip() or not row[1].strip():
+                continue
+            
+            artist = row[0].strip()
+            song = row[1].strip()
+            output_file = row[2].strip() if len(row) > 2 and row[2].strip() else suggest_filename(artist, song)
+            pairs.append((artist, song, output_file))
+    return pairs
+
+# The readline module once _enable_input_history() has set it up
+_readline = None
+
+def _enable_input_history():
+    """
+    Let the arrow keys recall earlier artist/song entries, across sessions too
+    
+    Uses readline where available (pyreadline3 provides it on Windows);
+    without it input() just works as before.
+    """
+    global _readline
+    try:
+        import readline
+    except ImportError:
+        return
+    _readline = readline
+    
+    readline.parse_and_bind("tab: complete")
+    
+    try:
+        readline.read_history_file(HISTORY_FILE)
+    except OSError:
+        pass
+    
+    readline.set_history_length(500)
+    
+    def save_history():
+        try:
+            readline.write_history_file(HISTORY_FILE)
+        except OSError:
+            pass
+    
+    atexit.register(save_history)
+
+def _forget_input(text):
+    """Keep an answer that isn't an artist or song (filename, y/n, q) out of the history"""
+    if _readline is None or not text:
+        return
+    
+    # Empty answers are never added, so only remove the entry if it really is this one
+    length = _readline.get_current_history_length()
+    if length and (_readline.get_history_item(length) or '').strip() == text:
+        _readline.remove_history_item(length - 1)
+
 def main():
     """Main function"""
     
+    # Batch mode: python download_lyrics_v2.py --batch songs.csv
+    if len(sys.argv) >= 3 and sys.argv[1] == '--batch':
+        download_batch(read_batch_file(sys.argv[2]))
+        return
+    
+    _enable_input_history()
+    
     print("\n" + "="*70)
     print(f"{Colors.BOLD}{Colors.CYAN}  🎵 LYRICS DOWNLOADER - LRClib API 🎵{Colors.END}")
     print("="*70 + "\n")
@@ -143,6 +455,7 @@ def main():
         artist = input(f"{Colors.GREEN}Artist: {Colors.END}").strip()
         
         if artist.lower() == 'q':
+            _forget_input(artist)
             print(f"\n{Colors.CYAN}Thanks for using Lyrics Downloader! 🎵{Colors.END}\n")
             break
         
@@ -159,14 +472,13 @@ def main():
             continue
         
         # Suggest output filename
-        suggested_filename = f"{artist} - {song}.lrc"
-        # Replace invalid characters for filenames
-        suggested_filename = suggested_filename.replace('/', '-').replace('\\', '-').replace(':', '-').replace('*', '').replace('?', '').replace('"', '').replace('<', '').replace('>', '').replace('|', '')
+        suggested_filename = suggest_filename(artist, song)
         
         print(f"\n{Colors.CYAN}{Colors.BOLD}Step 3: Output Filename{Colors.END}")
         print(f"{Colors.DIM}Suggested: {suggested_filename}{Colors.END}")
         print(f"{Colors.DIM}(Press Enter to use suggested, or type your own){Colors.END}")
         filename = input(f"{Colors.GREEN}Filename: {Colors.END}").strip()
+        _forget_input(filename)
         
         if not filename:
             filename = suggested_filename
@@ -195,7 +507,9 @@ def main():
         
         # Ask if user wants to download another
         print(f"\n{Colors.BOLD}Download another song?{Colors.END}")
-        again = input(f"{Colors.YELLOW}(y/n): {Colors.END}").strip().lower()
+        again = input(f"{Colors.YELLOW}(y/n): {Colors.END}").strip()
+        _forget_input(again)
+        again = again.lower()
         
         if again != 'y':
             print(f"\n{Colors.CYAN}Thanks for using Lyrics Downloader! 🎵{Colors.END}\n")
@@ -1,8 +1,15 @@
-import pygame
 import time
 import sys
 import os
-import glob
+import re
+import bisect
+import array
+import functools
+import collections
+import io
+import shutil
+import unicodedata
+from concurrent.futures import ThreadPoolExecutor
 
 class Colors:
     """ANSI color codes for terminal"""
@@ -17,6 +24,120 @@ class Colors:
     UNDERLINE = '\033[4m'
     END = '\033[0m'
 
+# Move the cursor home and erase the screen below it - clears the screen or
+# redraws a frame without spawning a 'cls'/'clear' process every time
+_REDRAW = '\033[H\033[J'
+
+# Move the cursor up a number of rows, to the start of the line, and erase
+# from the cursor down. Used to rewrite the lyrics and progress parts of the
+# frame without redrawing the header above them. The move is relative, so it
+# still lands in the right place after a long line has made the screen scroll
+_CURSOR_UP = '\033[{}F'
+_ERASE_BELOW = '\033[J'
+
+# Color codes, which take up no room on screen
+_ANSI_RE = re.compile(r'\033\[[0-9;]*m')
+
+# Static pieces of the karaoke frame, built once instead of on every redraw
+_RULE = "=" * 70
+_LYRIC_RULE = "  " + "━" * 66
+_BAR_WIDTH = 50
+_BAR_FULL = "█" * _BAR_WIDTH
+_BAR_EMPTY = "░" * _BAR_WIDTH
+_FRAME_FOOTER = f"  {Colors.DIM}Press Ctrl+C to stop{Colors.END}"
+
+# One timed LRC line: [mm:ss.xx]text. Anchored to the start of a line, so
+# blank, metadata and plain-text lines are rejected on their first character
+_LRC_RE = re.compile(r'^[ \t]*\[(\d+):(\d+)(?:\.(\d+))?\](.*)', re.MULTILINE)
+
+# Mixer settings. A 512-sample SDL buffer (~12 ms at 44.1 kHz) instead of the
+# default 4096 keeps the delay between play() and the first sound small,
+# so the lyric clock stays in step with what you hear
+MIXER_FREQUENCY = 44100
+MIXER_BUFFER = 512
+# Used instead if the audio driver won't open with a buffer that small
+MIXER_FALLBACK_BUFFER = 1024
+
+# pygame is imported on first use by _init_mixer(), so just browsing the
+# song menu never pays for loading SDL and its audio drivers
+pygame = None
+
+def _init_mixer():
+    """Import pygame and start its mixer, once per process"""
+    global pygame
+    if pygame is None:
+        import pygame
+    
+    if not pygame.mixer.get_init():
+        try:
+            pygame.mixer.pre_init(frequency=MIXER_FREQUENCY, size=-16, channels=2, buffer=MIXER_BUFFER)
+            pygame.mixer.init()
+        except pygame.error:
+            pygame.mixer.pre_init(frequency=MIXER_FREQUENCY, size=-16, channels=2, buffer=MIXER_FALLBACK_BUFFER)
+            pygame.mixer.init()
+
+def _enable_vt_mode():
+    """Let the Windows console interpret ANSI escapes (other terminals already do)"""
+    if os.name != 'nt':
+        return
+    
+    try:
+        import ctypes
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+        mode = ctypes.c_uint32()
+        if kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+            kernel32.SetConsoleMode(handle, mode.value | 0x0004)  # ENABLE_VIRTUAL_TERMINAL_PROCESSING
+    except (AttributeError, OSError):
+        pass
+
+# Files read ahead of time by _preload(), keyed by path
+_PRELOADED = {}
+
+def _preload(song):
+    """
+    Read a song's audio and lyrics into memory in the background
+    
+    Starting that song next then skips the disk reads, which matters
+    most for large MP3s on slow or network drives.
+    """
+    contents = {}
+    try:
+        with open(song['mp3_path'], 'rb') as f:
+            contents[song['mp3_path']] = f.read()
+        if song['lrc_path']:
+            with open(song['lrc_path'], 'r', encoding='utf-8', errors='replace') as f:
+                contents[song['lrc_path']] = f.read()
+    except OSError:
+        return
+    
+    # Only ever hold one song in memory
+    _PRELOADED.clear()
+    _PRELOADED.update(contents)
+
+def _display_width(line):
+    """Terminal columns a line of text takes up"""
+    if line.isascii():
+        return len(line)
+    
+    # Wide characters (CJK, most emoji) take two columns, combining marks none
+    width = 0
+    for char in line:
+        if unicodedata.combining(char):
+            continue
+        width += 2 if unicodedata.east_asian_width(char) in 'WF' else 1
+    return width
+
+def _screen_rows(text, width):
+    """Number of terminal rows text takes up when long lines wrap at width columns"""
+    return sum(max(1, -(-_display_width(line) // width)) for line in _ANSI_RE.sub('', text).split('\n'))
+
+@functools.lru_cache(maxsize=1024)
+def _format_whole_seconds(seconds):
+    """MM:SS for a whole number of seconds (cached, the display only ticks once a second)"""
+    mins, secs = divmod(seconds, 60)
+    return f"{mins:02d}:{secs:02d}"
+
 class SongLibrary:
     """Manages the song library and file discovery"""
     
@@ -39,8 +160,7 @@ class SongLibrary:
         print(f"  Lyrics: {Colors.BOLD}{self.lyrics_folder}{Colors.END}\n")
         
         # Find all MP3 files
-        mp3_pattern = os.path.join(self.music_folder, "*.mp3")
-        mp3_files = glob.glob(mp3_pattern)
+        mp3_files = [entry.path for entry in self._list_files(self.music_folder, '.mp3')]
         
         if not mp3_files:
             print(f"{Colors.RED}✗ No MP3 files found in folder!{Colors.END}")
@@ -49,9 +169,9 @@ class SongLibrary:
         
         print(f"{Colors.GREEN}✓ Found {len(mp3_files)} MP3 file(s){Colors.END}")
         
-        # Also show LRC files found
-        lrc_pattern = os.path.join(self.lyrics_folder, "*.lrc")
-        lrc_files = glob.glob(lrc_pattern)
+        # Also show LRC files found. The folder is read once here, and matching
+        # below is done against this listing instead of one stat() per candidate
+        lrc_files = {entry.name.lower(): entry.path for entry in self._list_files(self.lyrics_folder, '.lrc')}
         print(f"{Colors.CYAN}✓ Found {len(lrc_files)} LRC file(s){Colors.END}\n")
         
         # For each MP3, check if there's a matching LRC file
@@ -60,26 +180,15 @@ class SongLibrary:
             mp3_name = os.path.splitext(mp3_filename)[0]
             
             # Look for matching LRC file in lyrics folder
-            # Try exact match first
-            lrc_path = os.path.join(self.lyrics_folder, f"{mp3_name}.lrc")
-            
-            # If exact match doesn't exist, look for any LRC with similar name
-            if not os.path.exists(lrc_path):
-                # Try variations
-                possible_lrc = [
-                    os.path.join(self.lyrics_folder, f"{mp3_name}_synced.lrc"),
-                    os.path.join(self.lyrics_folder, f"{mp3_name}_early.lrc"),
-                    os.path.join(self.lyrics_folder, f"{mp3_name}_adjusted.lrc"),
-                    os.path.join(self.lyrics_folder, f"{mp3_name}_complete.lrc"),
-                ]
-                
-                for lrc in possible_lrc:
-                    if os.path.exists(lrc):
-                        lrc_path = lrc
-                        break
+            # Try exact match first, then variations
+            lrc_path = None
+            for suffix in ("", "_synced", "_early", "_adjusted", "_complete"):
+                lrc_path = lrc_files.get(f"{mp3_name}{suffix}.lrc".lower())
+                if lrc_path:
+                    break
             
             # Check if LRC exists
-            has_lyrics = os.path.exists(lrc_path)
+            has_lyrics = lrc_path is not None
             
             # Try to extract artist and title from filename
             # Common formats: "Artist - Song.mp3" or "Song.mp3"
@@ -93,7 +202,7 @@ class SongLibrary:
             
             self.songs.append({
                 'mp3_path': mp3_path,
-                'lrc_path': lrc_path if has_lyrics else None,
+                'lrc_path': lrc_path,
                 'filename': mp3_filename,
                 'artist': artist,
                 'title': title,
@@ -105,6 +214,19 @@ class SongLibrary:
         
         return True
     
+    def _list_files(self, folder, extension):
+        """List the (non-hidden) files in folder with the given extension"""
+        try:
+            with os.scandir(folder) as entries:
+                return [
+                    entry for entry in entries
+                    if entry.name.lower().endswith(extension)
+                    and not entry.name.startswith('.')
+                    and entry.is_file()
+                ]
+        except OSError:
+            return []
+    
     def display_songs(self):
         """Display the list of available songs"""
         print("\n" + "="*70)
@@ -135,11 +257,26 @@ class KaraokePlayer:
         self.lyrics_file = lyrics_file
         self.song_title = song_title
         self.artist = artist
-        self.lyrics = []
-        self.start_time = None
+        # Lyrics are kept as two parallel sequences, sorted by time. Times are a
+        # packed array of doubles, which is what the playback loop bisects
+        self.lyric_times = array.array('d')
+        self.lyric_texts = []
+        self.total_duration = 0
+        self.total_duration_str = self.format_time(0)
+        self.bar_scale = 0
+        self.position = 0.0
+        self.audio_buffer = None
+        
+        # The last few lines sung - the current one plus up to 3 before it,
+        # which is all the screen ever shows
+        self.recent_lines = collections.deque(maxlen=4)
+        
+        # Screen clears and redraws are ANSI escapes, which Windows consoles
+        # only interpret once asked to
+        _enable_vt_mode()
         
         # Initialize pygame mixer for audio
-        pygame.mixer.init()
+        _init_mixer()
         
     def load_lyrics(self):
         """Load and parse the LRC lyrics file"""
@@ -150,59 +287,64 @@ class KaraokePlayer:
         
         print(f"{Colors.CYAN}Loading lyrics from: {os.path.basename(self.lyrics_file)}{Colors.END}")
         
-        try:
-            with open(self.lyrics_file, 'r', encoding='utf-8') as file:
-                lines = file.readlines()
-        except FileNotFoundError:
-            print(f"{Colors.RED}✗ Lyrics file not found!{Colors.END}")
-            return False
-        
-        for line in lines:
-            line = line.strip()
-            if not line or ']' not in line:
-                continue
-            
-            bracket_pos = line.find(']')
-            timestamp = line[1:bracket_pos]
-            text = line[bracket_pos + 1:].strip()
-            
+        # Read the whole file in one call; the regex below scans it in one pass.
+        # Undecodable bytes are replaced so one bad character can't lose the song
+        data = _PRELOADED.pop(self.lyrics_file, None)
+        if data is None:
+            try:
+                with open(self.lyrics_file, 'r', encoding='utf-8', errors='replace') as file:
+                    data = file.read()
+            except FileNotFoundError:
+                print(f"{Colors.RED}✗ Lyrics file not found!{Colors.END}")
+                return False
+            except OSError as e:
+                print(f"{Colors.RED}✗ Error reading lyrics: {e}{Colors.END}")
+                return False
+        
+        times = []
+        texts = []
+        
+        for match in _LRC_RE.finditer(data):
+            text = match.group(4).strip()
             if not text:
                 continue
             
-            try:
-                parts = timestamp.split(':')
-                minutes = int(parts[0])
-                sec_parts = parts[1].split('.')
-                seconds = int(sec_parts[0])
-                centiseconds = int(sec_parts[1]) if len(sec_parts) > 1 else 0
-                
-                total_seconds = minutes * 60 + seconds + centiseconds / 100.0
-                
-                self.lyrics.append({
-                    'time': total_seconds,
-                    'text': text,
-                    'timestamp': timestamp
-                })
-            except:
-                continue
+            minutes, seconds, centiseconds = match.group(1, 2, 3)
+            times.append(int(minutes) * 60 + int(seconds) + int(centiseconds or 0) / 100.0)
+            texts.append(text)
         
-        if not self.lyrics:
+        if not times:
             print(f"{Colors.RED}✗ No valid lyrics found in file!{Colors.END}")
             return False
         
-        self.lyrics.sort(key=lambda x: x['time'])
-        total_duration = self.lyrics[-1]['time']
+        # Sort both lists by time (stable, so lines sharing a timestamp keep file order)
+        order = sorted(range(len(times)), key=times.__getitem__)
+        self.lyric_times = array.array('d', [times[i] for i in order])
+        self.lyric_texts = [texts[i] for i in order]
+        
+        # Estimated song length for the progress display: a little past the
+        # last line. Fixed for the whole song, so format it just once
+        self.total_duration = self.lyric_times[-1] + 10
+        self.total_duration_str = self.format_time(self.total_duration)
+        self.bar_scale = _BAR_WIDTH / self.total_duration  # Bar cells per second
         
-        print(f"{Colors.GREEN}✓ Loaded {len(self.lyrics)} lines of lyrics!{Colors.END}")
-        print(f"{Colors.CYAN}  Duration: {self.format_time(total_duration)}{Colors.END}\n")
+        print(f"{Colors.GREEN}✓ Loaded {len(self.lyric_times)} lines of lyrics!{Colors.END}")
+        print(f"{Colors.CYAN}  Duration: {self.format_time(self.lyric_times[-1])}{Colors.END}\n")
         
         return True
         
     def load_audio(self):
         """Load the audio file"""
         print(f"{Colors.CYAN}Loading audio from: {os.path.basename(self.audio_file)}{Colors.END}")
+        audio_data = _PRELOADED.pop(self.audio_file, None)
         try:
-            pygame.mixer.music.load(self.audio_file)
+            if audio_data is not None:
+                # Already in memory. Keep a reference to the buffer, pygame
+                # streams from it while the song plays
+                self.audio_buffer = io.BytesIO(audio_data)
+                pygame.mixer.music.load(self.audio_buffer, os.path.splitext(self.audio_file)[1][1:])
+            else:
+                pygame.mixer.music.load(self.audio_file)
             print(f"{Colors.GREEN}✓ Audio loaded successfully!{Colors.END}\n")
             return True
         except Exception as e:
@@ -211,19 +353,45 @@ class KaraokePlayer:
         
     def clear_screen(self):
         """Clear the terminal screen"""
-        os.system('cls' if os.name == 'nt' else 'clear')
+        sys.stdout.write(_REDRAW)
+        sys.stdout.flush()
     
-    def format_time(self, seconds):
+    @staticmethod
+    def format_time(seconds):
         """Format seconds into MM:SS"""
-        mins = int(seconds // 60)
-        secs = int(seconds % 60)
-        return f"{mins:02d}:{secs:02d}"
+        return _format_whole_seconds(int(seconds))
     
     def get_current_time(self):
         """Get the current playback time"""
-        if self.start_time is None:
-            return 0
-        return time.time() - self.start_time
+        # Taken from the mixer itself rather than the wall clock, so it can't
+        # drift from the audio (e.g. after the system sleeps). get_pos() is -1
+        # when nothing is playing, and then the last known position is kept
+        pos = pygame.mixer.music.get_pos()
+        if pos >= 0:
+            self.position = pos / 1000.0
+        return self.position
+    
+    def _status_lines(self, current_time, current_line_index, elapsed_str):
+        """Lines of the part of the karaoke frame that changes every second"""
+        lines = []
+        
+        # Show next line preview
+        if current_line_index < len(self.lyric_times):
+            time_until_next = self.lyric_times[current_line_index] - current_time
+            if time_until_next > 0 and time_until_next < 10:
+                lines.append(f"{Colors.DIM}  Coming up in {time_until_next:.1f}s: {self.lyric_texts[current_line_index]}{Colors.END}\n")
+        
+        # Progress bar
+        filled = min(int(current_time * self.bar_scale), _BAR_WIDTH)
+        bar = _BAR_FULL[:filled] + _BAR_EMPTY[filled:]
+        
+        lines.append(f"\n  {Colors.GREEN}{bar}{Colors.END}")
+        lines.append(f"  {Colors.CYAN}⏱  {elapsed_str} / ~{self.total_duration_str}{Colors.END}")
+        lines.append(f"  {Colors.DIM}Line {current_line_index}/{len(self.lyric_times)}{Colors.END}")
+        
+        lines.append(f"\n  {Colors.DIM}🔊 Volume: {int(pygame.mixer.music.get_volume() * 100)}%{Colors.END}")
+        lines.append(_FRAME_FOOTER)
+        return lines
     
     def play(self):
         """Play the music and display synchronized lyrics"""
@@ -234,8 +402,8 @@ class KaraokePlayer:
         print(f"{Colors.BOLD}{Colors.CYAN}  {self.song_title} - {self.artist}{Colors.END}")
         print(f"\n{Colors.GREEN}🔊 Audio playback enabled!{Colors.END}")
         
-        if self.lyrics:
-            print(f"{Colors.CYAN}📝 {len(self.lyrics)} lyrics lines ready{Colors.END}")
+        if self.lyric_times:
+            print(f"{Colors.CYAN}📝 {len(self.lyric_times)} lyrics lines ready{Colors.END}")
         else:
             print(f"{Colors.YELLOW}⚠ Playing audio only (no lyrics){Colors.END}")
         
@@ -247,9 +415,9 @@ class KaraokePlayer:
         
         # Start playing the music
         pygame.mixer.music.play()
-        self.start_time = time.time()
+        self.position = 0.0
         
-        if not self.lyrics:
+        if not self.lyric_times:
             # Audio only mode
             print("\n" + Colors.BOLD + Colors.HEADER + "="*70)
             print(f"         🎵 NOW PLAYING: {self.song_title} 🎵         ")
@@ -258,85 +426,116 @@ class KaraokePlayer:
             print(f"\n{Colors.YELLOW}Audio only - no lyrics available{Colors.END}")
             print(f"{Colors.CYAN}Press Ctrl+C to stop{Colors.END}\n")
             
-            # Just wait for music to finish
+            # Just wait for music to finish, keeping track of the position so
+            # the summary can show how long it played (get_pos() is -1 by then)
             while pygame.mixer.music.get_busy():
+                self.get_current_time()
                 time.sleep(0.1)
         else:
             # Karaoke mode with lyrics
-            displayed_lines = []
+            
+            # Parts of the frame that don't change while the song plays
+            frame_header = (
+                "\n" + Colors.BOLD + Colors.HEADER + _RULE + "\n"
+                + f"         🎵 NOW PLAYING: {self.song_title} 🎵         \n"
+                + _RULE + Colors.END + "\n"
+                + f"{Colors.DIM}  by {self.artist}{Colors.END}\n"
+            )
+            
+            self.recent_lines.clear()
             current_line_index = 0
             last_update_time = 0
+            last_second = -1
+            lyric_rows = 0
+            status_rows = 0
+            frame_drawn = False
+            header_on_screen = False
             
             while True:
                 if not pygame.mixer.music.get_busy():
                     break
                 
                 current_time = self.get_current_time()
-                should_update = False
                 
-                if current_line_index < len(self.lyrics):
-                    next_lyric = self.lyrics[current_line_index]
-                    
-                    if current_time >= next_lyric['time']:
-                        should_update = True
-                        lyric = next_lyric
-                        current_line_index += 1
-                        displayed_lines.append(lyric['text'])
+                # Number of lines whose timestamp has passed (binary search,
+                # so this stays correct even if playback jumps ahead)
+                new_line_index = bisect.bisect_right(self.lyric_times, current_time)
+                line_changed = new_line_index != current_line_index
                 
-                if should_update or (current_time - last_update_time) >= 0.5:
-                    last_update_time = current_time
-                    
-                    self.clear_screen()
-                    
-                    # Header
-                    print("\n" + Colors.BOLD + Colors.HEADER + "="*70)
-                    print(f"         🎵 NOW PLAYING: {self.song_title} 🎵         ")
-                    print("="*70 + Colors.END)
-                    print(f"{Colors.DIM}  by {self.artist}{Colors.END}\n")
+                if line_changed:
+                    if new_line_index < current_line_index:
+                        self.recent_lines.clear()
+                        current_line_index = 0
+                    self.recent_lines.extend(self.lyric_texts[max(current_line_index, new_line_index - 4):new_line_index])
+                    current_line_index = new_line_index
+                
+                # The whole frame is collected here and written in one go,
+                # rather than a dozen separate print() calls
+                parts = None
+                
+                if line_changed or not frame_drawn:
+                    if header_on_screen:
+                        # New line: move back up over the lyrics and status
+                        # drawn last time and redraw them, the header above
+                        # stays as it is
+                        frame_prefix = _CURSOR_UP.format(lyric_rows + status_rows) + _ERASE_BELOW
+                    else:
+                        # First frame, or the last one was too tall and pushed
+                        # the header off screen: clear and draw everything
+                        frame_prefix = _REDRAW + frame_header + "\n"
+                    parts = []
+                    terminal_size = shutil.get_terminal_size()
+                    width = terminal_size.columns
                     
                     # Show previous lines
-                    if displayed_lines:
-                        num_prev = min(3, len(displayed_lines) - 1) if should_update else min(3, len(displayed_lines))
-                        start_idx = max(0, len(displayed_lines) - num_prev - (1 if should_update else 0))
-                        
-                        for prev_line in displayed_lines[start_idx:len(displayed_lines) - (1 if should_update else 0)]:
-                            print(f"{Colors.DIM}  {prev_line}{Colors.END}")
-                        
-                        if num_prev > 0:
-                            print()
+                    recent_lines = list(self.recent_lines)
+                    prev_lines = recent_lines[:-1]
+                    for prev_line in prev_lines:
+                        parts.append(f"{Colors.DIM}  {prev_line}{Colors.END}")
+                    
+                    if prev_lines:
+                        parts.append("")
                     
                     # Show current line
-                    if should_update and displayed_lines:
-                        current_lyric_text = displayed_lines[-1]
-                        print(Colors.BOLD + Colors.CYAN + "  " + "━" * 66)
-                        print(f"  ♪  {Colors.YELLOW}{current_lyric_text}{Colors.CYAN}  ♪")
-                        print("  " + "━" * 66 + Colors.END)
-                        print()
-                    elif displayed_lines:
-                        print(f"{Colors.BOLD}  {displayed_lines[-1]}{Colors.END}\n")
+                    if recent_lines:
+                        parts.append(Colors.BOLD + Colors.CYAN + _LYRIC_RULE)
+                        parts.append(f"  ♪  {Colors.YELLOW}{recent_lines[-1]}{Colors.CYAN}  ♪")
+                        parts.append(_LYRIC_RULE + Colors.END)
+                        parts.append("")
+                    
+                    lyric_rows = _screen_rows("\n".join(parts), width) if parts else 0
+                    frame_drawn = True
+                elif int(current_time) != int(last_update_time):
+                    # Clock tick: the lyrics on screen are unchanged, only
+                    # rewrite the preview/progress block under them
+                    parts = []
+                    frame_prefix = _CURSOR_UP.format(status_rows) + _ERASE_BELOW
+                
+                if parts is not None:
+                    last_update_time = current_time
                     
-                    # Show next line preview
-                    if current_line_index < len(self.lyrics):
-                        next_line = self.lyrics[current_line_index]
-                        time_until_next = next_line['time'] - current_time
-                        if time_until_next > 0 and time_until_next < 10:
-                            print(f"{Colors.DIM}  Coming up in {time_until_next:.1f}s: {next_line['text']}{Colors.END}\n")
+                    # The clock only shows whole seconds
+                    if int(current_time) != last_second:
+                        last_second = int(current_time)
+                        elapsed_str = self.format_time(current_time)
                     
-                    # Progress bar
-                    total_duration = self.lyrics[-1]['time'] + 10
-                    progress = min(current_time / total_duration, 1.0)
-                    bar_width = 50
-                    filled = int(bar_width * progress)
-                    bar = "█" * filled + "░" * (bar_width - filled)
+                    status = "\n".join(self._status_lines(current_time, current_line_index, elapsed_str))
+                    parts.append(status)
+                    sys.stdout.write(frame_prefix + "\n".join(parts) + "\n")
+                    sys.stdout.flush()
                     
-                    print(f"\n  {Colors.GREEN}{bar}{Colors.END}")
-                    print(f"  {Colors.CYAN}⏱  {self.format_time(current_time)} / ~{self.format_time(total_duration)}{Colors.END}")
-                    print(f"  {Colors.DIM}Line {len(displayed_lines)}/{len(self.lyrics)}{Colors.END}")
+                    # How far the next clock tick (or new line) has to move back up
+                    status_rows = _screen_rows(status, width)
                     
-                    print(f"\n  {Colors.DIM}🔊 Volume: {int(pygame.mixer.music.get_volume() * 100)}%{Colors.END}")
-                    print(f"  {Colors.DIM}Press Ctrl+C to stop{Colors.END}")
+                    # Whether the frame fit, or scrolled the header away
+                    header_on_screen = _screen_rows(frame_header, width) + lyric_rows + status_rows < terminal_size.lines
                 
-                time.sleep(0.05)
+                # Sleep until the next lyric line or the next whole second,
+                # whichever comes first, instead of polling at a fixed rate
+                next_event = int(current_time) + 1
+                if current_line_index < len(self.lyric_times):
+                    next_event = min(next_event, self.lyric_times[current_line_index])
+                time.sleep(max(next_event - current_time, 0.01))
         
         # Final screen
         time.sleep(1)
@@ -348,13 +547,19 @@ class KaraokePlayer:
         print(f"{Colors.BOLD}Session Summary:{Colors.END}\n")
         print(f"  Song: {self.song_title}")
         print(f"  Artist: {self.artist}")
-        if self.lyrics:
-            print(f"  Total lines: {len(self.lyrics)}")
+        if self.lyric_times:
+            print(f"  Total lines: {len(self.lyric_times)}")
         print(f"  Duration: {self.format_time(self.get_current_time())}")
         print()
     
     def stop(self):
         """Stop the music playback"""
+        _stop_music()
+
+
+def _stop_music():
+    """Stop playback, if pygame was ever started"""
+    if pygame is not None and pygame.mixer.get_init():
         pygame.mixer.music.stop()
 
 
@@ -405,6 +610,9 @@ def main():
         input("\nPress Enter to exit...")
         return
     
+    # Background reader for the next song in the list
+    preloader = ThreadPoolExecutor(max_workers=1)
+    
     while True:
         # Display available songs
         library.display_songs()
@@ -453,6 +661,11 @@ def main():
                 input("\nPress Enter to continue...")
                 continue
             
+            # Read the next song in the list while this one plays
+            next_song = library.get_song_by_index(song_index + 1)
+            if next_song:
+                preloader.submit(_preload, next_song)
+            
             # Show ready message
             print(Colors.BOLD + "🎤 Ready to play!" + Colors.END)
             input(f"\n{Colors.GREEN}Press Enter to start...{Colors.END}")
@@ -474,6 +687,8 @@ def main():
         except KeyboardInterrupt:
             print(f"\n\n{Colors.YELLOW}Interrupted by user{Colors.END}")
             break
+    
+    preloader.shutdown(wait=False)
 
 
 if __name__ == "__main__":
@@ -481,12 +696,12 @@ if __name__ == "__main__":
         main()
     except KeyboardInterrupt:
         print(f"\n\n{Colors.YELLOW}⏹  Karaoke stopped. Thanks for singing!{Colors.END}\n")
-        pygame.mixer.music.stop()
+        _stop_music()
         sys.exit(0)
     except Exception as e:
         print(f"\n{Colors.RED}Error: {e}{Colors.END}\n")
         import traceback
         traceback.print_exc()
-        pygame.mixer.music.stop()
+        _stop_music()
         input("\nPress Enter to exit...")
         sys.exit(1)
\ No newline at end of file
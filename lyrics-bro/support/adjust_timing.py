@@ -1,5 +1,6 @@
 import os
 import sys
+import re
 
 class Colors:
     """ANSI color codes"""
@@ -11,41 +12,20 @@ class Colors:
     DIM = '\033[2m'
     END = '\033[0m'
 
-def parse_timestamp(timestamp):
-    """
-    Parse LRC timestamp to seconds
-    Format: MM:SS.CS or MM:SS
-    """
-    try:
-        parts = timestamp.split(':')
-        minutes = int(parts[0])
-        
-        if '.' in parts[1]:
-            sec_parts = parts[1].split('.')
-            seconds = int(sec_parts[0])
-            centiseconds = int(sec_parts[1])
-        else:
-            seconds = int(parts[1])
-            centiseconds = 0
-        
-        total_seconds = minutes * 60 + seconds + centiseconds / 100.0
-        return total_seconds
-    except:
-        return None
+# Read/write buffer for adjusting files (1 MiB)
+IO_BUFFER_SIZE = 1 << 20
 
-def format_timestamp(seconds):
-    """
-    Convert seconds back to LRC timestamp format
-    Format: MM:SS.CS
-    """
+# An LRC timestamp tag: [mm:ss] or [mm:ss.cs]
+_TS_RE = re.compile(r'\[(\d{1,3}):(\d{1,2})(?:\.(\d{1,3}))?\]')
+
+def _format_centiseconds(total_centiseconds):
+    """Format a whole number of centiseconds as MM:SS.CS"""
     # Handle negative times (shouldn't happen, but just in case)
-    if seconds < 0:
-        seconds = 0
+    if total_centiseconds < 0:
+        total_centiseconds = 0
     
-    minutes = int(seconds // 60)
-    remaining_seconds = seconds % 60
-    secs = int(remaining_seconds)
-    centiseconds = int((remaining_seconds - secs) * 100)
+    minutes, rest = divmod(total_centiseconds, 6000)
+    secs, centiseconds = divmod(rest, 100)
     
     return f"{minutes:02d}:{secs:02d}.{centiseconds:02d}"
 
@@ -70,61 +50,45 @@ def adjust_lrc_timing(input_file, output_file, offset_seconds):
         print(f"  {Colors.DIM}(Lyrics will appear {abs(offset_seconds):.2f}s earlier){Colors.END}")
     print()
     
+    # Timestamps are shifted in whole centiseconds, which is exact, where
+    # float seconds pick up rounding error
+    offset_centiseconds = round(offset_seconds * 100)
+    
+    def shift(match):
+        """Replace one timestamp tag with its adjusted value"""
+        minutes, seconds, centiseconds = match.group(1, 2, 3)
+        time_centiseconds = int(minutes) * 6000 + int(seconds) * 100 + int(centiseconds or 0)
+        return f"[{_format_centiseconds(time_centiseconds + offset_centiseconds)}]"
+    
+    adjusted_count = 0
+    preview_lines = []
+    
+    # Written next to the output and moved into place at the end, so the
+    # input can safely be the output file as well
+    tmp_file = f"{output_file}.tmp"
+    
     try:
-        # Read the input file
-        with open(input_file, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
-        
-        adjusted_lines = []
-        adjusted_count = 0
-        
-        for line in lines:
-            line = line.rstrip('\n\r')
-            
-            # Check if line contains a timestamp
-            if line and '[' in line and ']' in line:
-                bracket_start = line.find('[')
-                bracket_end = line.find(']')
+        # Stream the file through line by line, so memory use doesn't grow
+        # with the file. Metadata tags like [ar:Artist] don't match the
+        # timestamp pattern and are left alone
+        with open(input_file, 'r', encoding='utf-8', buffering=IO_BUFFER_SIZE) as f_in, \
+             open(tmp_file, 'w', encoding='utf-8', buffering=IO_BUFFER_SIZE) as f_out:
+            for line in f_in:
+                adjusted_line, count = _TS_RE.subn(shift, line)
+                f_out.write(adjusted_line)
+                adjusted_count += count
                 
-                if bracket_start >= 0 and bracket_end > bracket_start:
-                    # Extract timestamp
-                    timestamp = line[bracket_start + 1:bracket_end]
-                    text = line[bracket_end + 1:]
-                    
-                    # Parse timestamp
-                    time_seconds = parse_timestamp(timestamp)
-                    
-                    if time_seconds is not None:
-                        # Adjust time
-                        new_time = time_seconds + offset_seconds
-                        
-                        # Format new timestamp
-                        new_timestamp = format_timestamp(new_time)
-                        
-                        # Create new line
-                        new_line = f"[{new_timestamp}]{text}"
-                        adjusted_lines.append(new_line)
-                        adjusted_count += 1
-                    else:
-                        # Couldn't parse, keep original
-                        adjusted_lines.append(line)
-                else:
-                    # No valid brackets, keep original
-                    adjusted_lines.append(line)
-            else:
-                # No timestamp, keep original
-                adjusted_lines.append(line)
+                if len(preview_lines) < 5:
+                    preview_lines.append(adjusted_line.rstrip('\n'))
         
-        # Write to output file
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write('\n'.join(adjusted_lines))
+        os.replace(tmp_file, output_file)
         
         print(f"{Colors.GREEN}✓ Successfully adjusted {adjusted_count} timestamps!{Colors.END}")
         print(f"{Colors.GREEN}✓ Saved to: {output_file}{Colors.END}\n")
         
         # Show preview
         print(f"{Colors.BOLD}Preview (first 5 lines):{Colors.END}")
-        for line in adjusted_lines[:5]:
+        for line in preview_lines:
             if line.strip():
                 print(f"  {line}")
         print()
@@ -135,6 +99,8 @@ def adjust_lrc_timing(input_file, output_file, offset_seconds):
         print(f"{Colors.RED}✗ Error: Input file not found!{Colors.END}\n")
         return False
     except Exception as e:
+        if os.path.exists(tmp_file):
+            os.remove(tmp_file)
         print(f"{Colors.RED}✗ Error: {e}{Colors.END}\n")
         return False
 